@@ -2,6 +2,8 @@ import os
 import sys
 import time
 import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, filedialog, simpledialog, messagebox as tkmsg
 import customtkinter as ctk
@@ -11,9 +13,10 @@ import matplotlib.pyplot as plt
 from matplotlib.widgets import RectangleSelector
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 from matplotlib.backends.backend_pdf import PdfPages
-from PIL import Image, ImageTk
+from PIL import Image, ImageSequence, ImageTk
 from datetime import datetime
 from json import load
+from functools import lru_cache
 
 # ──────────────────────────────────────────────────────────────────────────────
 # 1) VERSION AND UPDATE_INFO_URL (DEPRECATED)
@@ -58,6 +61,172 @@ try:
 except Exception:
     pass
 
+# Prefer the Rust-based calamine reader for Excel files (much faster than openpyxl).
+# Without it, pandas picks its default engine (openpyxl for .xlsx, xlrd for .xls).
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
+
+# Arrow-backed columns (pandas >= 2) hold nulls in a validity bitmap instead of
+# upcasting, and convert to NumPy without an object round-trip.
+try:
+    import pyarrow  # noqa: F401
+    READ_KWARGS = {"dtype_backend": "pyarrow"}
+except ImportError:
+    READ_KWARGS = {}
+
+
+# SciPy's pocketfft runs multi-threaded (workers=-1) and caches plans between
+# same-size calls; fall back to NumPy's single-threaded FFT without it.
+try:
+    from scipy import fft as _fft
+    FFT_KWARGS = {"workers": -1}
+except ImportError:
+    _fft = np.fft
+    FFT_KWARGS = {}
+
+# cuFFT through CuPy for large batched zone FFTs when a CUDA device is present;
+# smaller transforms stay on the CPU, where the host/device copies would dominate.
+try:
+    import cupy as cp
+    HAS_CUPY = cp.cuda.runtime.getDeviceCount() > 0
+except Exception:
+    HAS_CUPY = False
+GPU_FFT_MIN_BYTES = 4 << 20
+
+# numexpr evaluates a compound comparison in one multi-threaded pass, without the
+# two intermediate boolean arrays NumPy builds for `(a >= x) & (a <= y)`.
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+
+@lru_cache(maxsize=32)
+def _fft_freqs(N, dt):
+    """
+    Frequency axis of an N-point rfft at sample spacing `dt`. Zones cut from one
+    recording usually share both, so the (read-only) array is cached and shared.
+    """
+    freqs = _fft.rfftfreq(N, d=dt)
+    freqs.setflags(write=False)
+    return freqs
+
+
+def _sample_spacing(t):
+    """
+    Sample spacing of time axis `t` from its endpoints (equal to mean(diff(t)), with no
+    O(N) temporary), or None when `t` spans no time: fewer than two samples or a zero or
+    negative span, which has no frequency axis.
+    """
+    if len(t) < 2:
+        return None
+    dt = float(t[-1] - t[0]) / (len(t) - 1)
+    return None if dt <= 0 else dt
+
+
+def _fft_amplitudes(data):
+    """
+    Single-sided amplitude spectrum (DC removed, scaled by 2/N) of every channel in
+    `data`, shaped (..., N samples, channels), transformed along the sample axis at
+    its own length N (no zero padding, so the bins are the analysis' own). Leading
+    axes are batched into a single rfft call. On the CPU path `data` is demeaned in
+    place.
+    """
+    N = data.shape[-2]
+    if HAS_CUPY and data.nbytes > GPU_FFT_MIN_BYTES:
+        try:
+            d = cp.asarray(data)
+            d -= d.mean(axis=-2, keepdims=True)
+            return cp.asnumpy(cp.abs(cp.fft.rfft(d, axis=-2)) * (2 / N))
+        except cp.cuda.memory.OutOfMemoryError:
+            pass  # too large for the device, fall back to the CPU
+    data -= data.mean(axis=-2, keepdims=True)
+    return np.abs(_fft.rfft(data, axis=-2, **FFT_KWARGS)) * (2 / N)
+
+
+def _hms_nanoseconds(values):
+    """
+    Nanoseconds since midnight for an array of fixed-width "HH:MM:SS" or
+    "HH:MM:SS.fff…" strings, decoded straight from their ASCII bytes with vectorized
+    integer arithmetic. Returns None unless every value has exactly that layout.
+    """
+    try:
+        raw = np.asarray(values, dtype="S")
+    except (UnicodeEncodeError, ValueError):
+        return None
+    width = raw.dtype.itemsize
+    if raw.size == 0 or width < 8 or width == 9:
+        return None
+    b = raw.view(np.uint8).reshape(-1, width)
+    d = b - np.uint8(ord("0"))  # non-digit bytes wrap around to values > 9
+    digit_cols = [0, 1, 3, 4, 6, 7] + list(range(9, width))
+    if not (d[:, digit_cols] <= 9).all():
+        return None
+    if not ((b[:, 2] == ord(":")).all() and (b[:, 5] == ord(":")).all()):
+        return None
+    if width > 8 and not (b[:, 8] == ord(".")).all():
+        return None
+
+    hh = d[:, 0] * np.int64(10) + d[:, 1]
+    mm = d[:, 3] * np.int64(10) + d[:, 4]
+    ss = d[:, 6] * np.int64(10) + d[:, 7]
+    if (hh > 23).any() or (mm > 59).any() or (ss > 59).any():
+        return None
+    ns = ((hh * 60 + mm) * 60 + ss) * 1_000_000_000
+    # Fractional digits, truncated to nanosecond resolution
+    for k in range(9, min(width, 18)):
+        ns += d[:, k] * np.int64(10 ** (17 - k))
+    return ns
+
+
+def _parse_times(times, date):
+    """
+    Combine a column of time-of-day values with `date` into timestamps (NaT where
+    unparseable). Uniform "HH:MM:SS[.fff]" columns are decoded directly from their
+    bytes. Otherwise pandas' ISO 8601 parser (C path, optional fractional seconds)
+    handles the rest, and only values it rejects (e.g. "1:00:00 PM") are parsed
+    element by element.
+    """
+    time_str = times.astype(str)
+    parsed = pd.Series(pd.NaT, index=times.index, dtype="datetime64[ns]")
+    pending = times.notna()
+    ns = _hms_nanoseconds(time_str[pending].to_numpy())
+    if ns is not None:
+        parsed[pending] = pd.Timestamp(date) + pd.to_timedelta(ns, unit="ns")
+        return parsed
+    stamp_str = date.strftime("%Y-%m-%d") + " " + time_str
+    for fmt in ("ISO8601", "mixed"):
+        if not pending.any():
+            break
+        parsed[pending] = pd.to_datetime(stamp_str[pending], format=fmt, errors="coerce")
+        pending &= parsed.isna()
+    return parsed
+
+
+def _minmax_decimate(x, y, target=2400):
+    """
+    Reduce (x, y) to roughly `target` points by keeping the minimum and maximum sample
+    of each bin (in their original order). The drawn envelope is unchanged while Agg
+    only has to process a few thousand vertices instead of the full trace.
+    """
+    n = len(y)
+    if n <= target:
+        return x, y
+    bin_size = int(np.ceil(2 * n / target))
+    n_full = (n // bin_size) * bin_size
+    bins = y[:n_full].reshape(-1, bin_size)
+    offsets = np.arange(0, n_full, bin_size)[:, None]
+    idx = np.sort(np.stack([bins.argmin(axis=1), bins.argmax(axis=1)], axis=1), axis=1) + offsets
+    idx = idx.ravel()
+    if n_full < n:
+        tail = y[n_full:]
+        idx = np.concatenate([idx, n_full + np.unique([tail.argmin(), tail.argmax()])])
+    return x[idx], y[idx]
+
+
 class AlphaAnalysisApp(ctk.CTk):
     """
     Main application class for Alpha Analysis.
@@ -83,7 +252,9 @@ class AlphaAnalysisApp(ctk.CTk):
         self.base_height = 900
         self.base_font_size = 12
         self.ui_font = "Segoe UI"
-        self._setup_scaling()
+        self._last_font_size = self._setup_scaling()
+        # Shared font object: resizing mutates it once and every widget using it follows
+        self.ui_style = ctk.CTkFont(family=self.ui_font, size=self._last_font_size)
 
         # Configure grid: controls panel (col 0), plot area (col 1)
         self.grid_columnconfigure(0, weight=0)
@@ -103,14 +274,28 @@ class AlphaAnalysisApp(ctk.CTk):
 
         # Internal state
         self.df = None
-        self.zones = []
+        self._elapsed_np = None # Elapsed column as a NumPy array, cached on load
+        self._elapsed_sorted = False # True when _elapsed_np is non-decreasing (binary-searchable)
+        self._P = None # Selected pressure columns as one C-contiguous float32 (N, C) matrix
+        # Zones stored as parallel arrays/lists (zone k = index k) for vectorized lookups
+        self._zone_starts = np.empty(0)
+        self._zone_ends = np.empty(0)
+        self._zone_patches = []
+        self._zone_labels = []
+        self._y_max = None # Highest pressure value, cached on load for zone label placement
+        self._zone_win = None # Shared zone analysis window, built on first confirm
+        self._zone_results = []
         self.time_col = None
         self.pressure_cols = []
         self.elapsed_col = None
         self.test_date = None
         self.header_row = None
-        self.collected_date_event = threading.Event()
-        self.bad_date_event = threading.Event()
+        self._xlsx = None # pd.ExcelFile opened at browse time for the preview and header reads
+        self._executor = ThreadPoolExecutor(max_workers=1) # off-UI-thread header-row reads
+        self._header_future = None # latest header-row read; older ones are ignored
+        self._load_gen = 0 # incremented per load; results from older loads are ignored
+        self._zone_fft_results = queue.Queue() # zone result list (or None on failure) from _compute_zone_ffts
+        self._zone_fft_pending = False
         self.elapsed_mode = tk.BooleanVar(value=False)
         self.save_data_mode = tk.BooleanVar(value=False)
 
@@ -118,6 +303,13 @@ class AlphaAnalysisApp(ctk.CTk):
         self._build_controls()
         self._build_plot()
 
+        # Decode the loading GIF up front so the first spinner tick has no decode latency.
+        # It is small (tens of ms), and PhotoImages must be created on the main thread anyway
+        try:
+            self._set_loading_frames(self._get_loading_frames())
+        except Exception:
+            pass  # retried by _play_loading_gif
+
         # Resize debounce
         self._resize_job = None
         self.bind("<Configure>", self._on_configure)
@@ -127,12 +319,14 @@ class AlphaAnalysisApp(ctk.CTk):
         # self._check_for_updates(autoUpdating=True)
 
     def _setup_scaling(self):
+        """
+        Apply Tk scaling for the current screen and return the matching UI font size.
+        """
         screen_w = self.winfo_screenwidth()
         screen_h = self.winfo_screenheight()
         scale = min(screen_w / self.base_width, screen_h / self.base_height)
         self.tk.call('tk', 'scaling', scale)
-        new_size = max(6, min(int(self.base_font_size * scale), 20))
-        self.ui_style = (self.ui_font, new_size)
+        return max(6, min(int(self.base_font_size * scale), 20))
 
     def _setup_control_canvas(self):
         self.control_canvas = tk.Canvas(self.control_container, borderwidth=0, highlightthickness=0)
@@ -262,8 +456,14 @@ class AlphaAnalysisApp(ctk.CTk):
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
         NavigationToolbar2Tk(self.canvas, self.plot_container)
         self.canvas.mpl_connect("button_press_event", self._on_click)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        # A resized canvas invalidates the cached background until the next full draw
+        self.canvas.get_tk_widget().bind("<Configure>", self._invalidate_background, add="+")
 
         self.rs = None # RectangleSelector will be instantiated once data is loaded
+        self._lines = {} # Persistent Line2D per pressure column, created once per load
+        self._bg = None # Cached axes background (without zone artists) for blitting
+        self._decim_key = None # (xlim, axes width) the current decimated traces were built for
 
         # Loading GIF setup
         loading_widget = self.canvas.get_tk_widget()
@@ -302,17 +502,17 @@ class AlphaAnalysisApp(ctk.CTk):
         Rescale fonts and redraw axis text when the window is resized.
         """
         self._resize_job = None
-        self._setup_scaling()
-        for w in self.control_frame.winfo_children():
-            try:
-                w.configure(font=self.ui_style)
-            except:
-                pass
+        new_size = self._setup_scaling()
+        if new_size == self._last_font_size:
+            return
+        self._last_font_size = new_size
+        # Widgets share self.ui_style, so a single configure restyles all of them
+        self.ui_style.configure(size=new_size)
         # Update plot fonts
         for txt in [self.ax.title, self.ax.xaxis.label, self.ax.yaxis.label]:
-            txt.set_fontsize(self.ui_style[1])
+            txt.set_fontsize(new_size)
         for lbl in self.ax.get_xticklabels() + self.ax.get_yticklabels():
-            lbl.set_fontsize(self.ui_style[1])
+            lbl.set_fontsize(new_size)
         self.canvas.draw()
 
     def _on_control_configure(self, event):
@@ -335,40 +535,75 @@ class AlphaAnalysisApp(ctk.CTk):
         # Reset state & hide header preview
         self.header_row = None
         self.time_col = None
-        self.pressure_cols = []
+        # self.pressure_cols is left alone: it names the columns of the data still on
+        # screen (and in self._P) until another load replaces it
         self.hdr_lbl.grid_remove()
         self.preview.grid_remove()
         self.time_cb.config(state="disabled", values=[])
         self.time_cb.set("")
         self.p_list.delete(0, "end")
-        self.zones = []
+        self._header_future = None
+        self._clear_zones()
+        # Drop the previous workbook handle; it belongs to the old file. The close runs on
+        # the header-read executor, after any read still using the handle (a handle
+        # cannot be used from two threads at once)
+        if self._xlsx is not None:
+            self._executor.submit(self._xlsx.close)
+            self._xlsx = None
         ext = os.path.splitext(path)[1].lower()
         if ext == ".parquet":
             try:
                 df0 = pd.read_parquet(path)
                 cols = list(df0.columns)
                 self.time_cb.config(values=cols, state="readonly")
-                for c in cols:
-                    self.p_list.insert("end", c)
+                self.p_list.insert("end", *cols)
             except Exception as e:
                 tkmsg.showerror("Error", f"Could not load Parquet:\n{e}")
         else:
             try:
-                df0 = pd.read_excel(path, nrows=15, header=None)
-                # Show header-selection widgets
-                self.hdr_lbl.grid()
-                self.preview.grid()
-                cols = [f"C{c}" for c in range(df0.shape[1])]
+                self._xlsx = self._open_workbook(path)
+                rows = self._read_preview_rows(15)
+                # Fill the tree while the preview is still unmapped so Tk lays it out once
+                cols = [f"C{c}" for c in range(max((len(r) for r in rows), default=0))]
                 self.tree.config(columns=cols)
                 for c in cols:
                     self.tree.heading(c, text=c)
                     self.tree.column(c, width=80, stretch=False)
                 self.tree.delete(*self.tree.get_children())
-                for idx, row in df0.iterrows():
+                for idx, row in enumerate(rows):
                     self.tree.insert("", "end", iid=str(idx), values=list(row))
+                # Show header-selection widgets
+                self.hdr_lbl.grid()
+                self.preview.grid()
             except Exception as e:
                 tkmsg.showerror("Error", f"Cannot read file:\n{e}")
 
+    def _open_workbook(self, path):
+        """
+        Open the workbook as a pd.ExcelFile, so the preview and every header-row read
+        parse from one handle instead of re-reading the file. If the preferred engine
+        cannot open it, retry with pandas' default engine.
+        """
+        try:
+            return pd.ExcelFile(path, engine=EXCEL_ENGINE)
+        except Exception:
+            if EXCEL_ENGINE is None:
+                raise
+            return pd.ExcelFile(path)
+
+    def _read_preview_rows(self, nrows):
+        """
+        Return the first `nrows` raw rows of the first sheet of self._xlsx as lists of
+        cell values. With calamine the rows are sliced straight from the already open
+        workbook without building a DataFrame; otherwise parse them through pandas.
+        """
+        if self._xlsx.engine == "calamine":
+            sheet = self._xlsx.book.get_sheet_by_index(0)
+            # Keep leading empty rows so row indices match the header row passed to pandas
+            return sheet.to_python(skip_empty_area=False, nrows=nrows)
+        df0 = self._xlsx.parse(header=None, nrows=nrows)
+        return df0.values.tolist()
+
     def _on_header_select(self, event):
         """
         Called when the user selects a header row in the Treeview.
@@ -379,119 +614,231 @@ class AlphaAnalysisApp(ctk.CTk):
         if not sel:
             return
         self.header_row = int(sel[0])
-        self.hdr_lbl.configure(text=f"Header row: {self.header_row + 1}")
-        path = self.file_lbl.cget("text")
-        
+        self.hdr_lbl.configure(text=f"Header row: {self.header_row + 1} (reading...)")
+
+        # Parse on the executor so the UI stays live; a newer selection or file supersedes it
+        fut = self._executor.submit(self._xlsx.parse, header=self.header_row, nrows=3)
+        self._header_future = fut
+        self.after(50, self._check_header_read, fut, self.header_row)
+
+    def _check_header_read(self, fut, header_row):
+        """
+        Main-thread poll for the header-row read started by _on_header_select. Fills the
+        time dropdown and pressure listbox with the column names once it completes.
+        """
+        if fut is not self._header_future:
+            return  # superseded by a newer selection or file
+        if not fut.done():
+            self.after(50, self._check_header_read, fut, header_row)
+            return
+        self._header_future = None
+        self.hdr_lbl.configure(text=f"Header row: {header_row + 1}")
         try:
-            df_headers = pd.read_excel(path, header=self.header_row, nrows=3)
+            df_headers = fut.result()
         except Exception as e:
-            tkmsg.showerror("Error", f"Cannot read with header row {self.header_row + 1}:\n{e}")
+            tkmsg.showerror("Error", f"Cannot read with header row {header_row + 1}:\n{e}")
             return
 
         cols = list(df_headers.columns)
         self.time_cb.config(values=cols, state="readonly")
         self.time_col = None
         self.p_list.delete(0, "end")
-        for c in cols:
-            self.p_list.insert("end", c)
+        self.p_list.insert("end", *cols)
 
     def _load_data_thread(self):
         """
         Spawn a background thread to load Excel data, prompt for date,
-        then process and plot.
+        then process and plot. The worker never touches Tk: its result is
+        collected on the main thread by _poll_worker.
         """
         if self.time_col is None or not self.p_list.curselection():
             tkmsg.showwarning("Incomplete", "Select header, time, and pressure columns.")
             return
 
         self._disable_controls()
-        self.collected_date_event.clear()
-
-        # Start data reading in background
-        threading.Thread(target=self._process_data, daemon=True).start()
-        threading.Thread(target=self._play_loading_gif, daemon=True).start()
+        # Each load gets its own date handoff and result queue plus a generation number,
+        # so a worker left over from a cancelled load can never pick up this load's date
+        # or have its result installed
+        self._load_gen += 1
+        date_box = queue.Queue(maxsize=1) # the test date, or None if the prompt was cancelled
+        results = queue.Queue() # (status, payload, elapsed_col) from _process_data
+        # Read widget state here: Tk widgets and variables are not thread-safe. The
+        # selection only becomes self.pressure_cols once this load's data is installed,
+        # so a cancelled load leaves it matching the data already on screen
+        pressure_cols = [self.p_list.get(i) for i in self.p_list.curselection()]
+        path = self.file_lbl.cget("text")
+        elapsed_mode = self.elapsed_mode.get()
+        # Only the time and selected pressure columns are ever used, so skip the rest
+        usecols = list(dict.fromkeys([self.time_col] + pressure_cols))
+
+        # Everything the worker needs is passed in; it never reads app state that the
+        # main thread can change once a cancelled prompt re-enables the controls
+        args = (
+            date_box, results, path, usecols, elapsed_mode,
+            self.time_col, self.header_row, pressure_cols,
+        )
+        # Start data reading in background; the GIF and result polling run on the main loop
+        threading.Thread(target=self._process_data, args=args, daemon=True).start()
+        self._play_loading_gif()
+        self.after(50, self._poll_worker, results, self._load_gen, pressure_cols)
 
         # Prompt for test date (YYYY-MM-DD)
         date_str = simpledialog.askstring("Test Date", "Enter date (YYYY-MM-DD):")
         if not date_str:
             self._enable_controls()
             self.finished_loading_event.set()
-            self.bad_date_event.set()
-            self.collected_date_event.set()
+            date_box.put(None)
             return
 
         try:
-            self.test_date = datetime.strptime(date_str, "%Y-%m-%d")
+            test_date = datetime.strptime(date_str, "%Y-%m-%d")
         except ValueError:
             tkmsg.showerror("Bad Date", "Date must be in format YYYY-MM-DD.")
             self._enable_controls()
             self.finished_loading_event.set()
-            self.bad_date_event.set()
-            self.collected_date_event.set()
+            date_box.put(None)
             return
 
-        self.pressure_cols = [self.p_list.get(i) for i in self.p_list.curselection()]
-        self.collected_date_event.set()
+        self.test_date = test_date
+        date_box.put(test_date)
 
-    def _process_data(self):
+    def _process_data(self, date_box, results, path, usecols, elapsed_mode, time_col, header_row, pressure_cols):
         """
-        Background worker: read the Excel file, convert time column into elapsed seconds
-        (or use numeric elapsed directly), then signal when data is ready.
+        Background worker, in two phases so the expensive file read overlaps the date
+        prompt: phase 1 reads the file (no date needed), phase 2 converts times once the
+        date arrives on `date_box` and is skipped, discarding the frame, if None (a
+        cancelled prompt) arrives instead. The result goes on `results`; no Tk calls
+        happen here.
         """
-        self.loading = True
-        path = self.file_lbl.cget("text")
+        # Phase 1: read
+        try:
+            df = self._read_data(path, usecols, elapsed_mode, time_col, header_row)
+        except Exception:
+            results.put(("error", "Data failed to load, cancelling.", None))
+            return
 
-        if os.path.splitext(self.file_lbl.cget("text"))[-1].lower() == ".parquet":
-            try:
-                self.df = pd.read_parquet(path)
-            except Exception:
-                tkmsg.showwarning("Incomplete", "Data failed to load, cancelling.")
-                return
-        else:
-            try:
-                self.df = pd.read_excel(path, header=self.header_row)
-            except Exception:
-                tkmsg.showwarning("Incomplete", "Data failed to load, cancelling.")
-                return
+        # Wait (parked, no CPU) for date input. No timeout: the prompt always answers,
+        # with None when cancelled, so the worker is never left waiting
+        test_date = date_box.get()
+        if test_date is None:
+            results.put(("cancelled", None, None))
+            return
 
-        # Wait for date input
-        self.collected_date_event.wait()
-        self.collected_date_event.clear()
-        if self.bad_date_event.is_set():
-            self.bad_date_event.clear()
+        # Phase 2: date-dependent transform
+        try:
+            df, elapsed_col = self._transform_data(df, elapsed_mode, test_date, time_col, pressure_cols)
+        except Exception:
+            results.put(("error", "Data failed to process, cancelling.", None))
             return
+        results.put(("ok", df, elapsed_col))
+
+    def _read_data(self, path, usecols, elapsed_mode, time_col, header_row):
+        """
+        Phase 1 of _process_data: read the `usecols` columns of the Excel/Parquet file
+        with `header_row` as the header row. The load opens its own workbook handle: a
+        handle cannot be used from two threads at once, and once a cancelled load
+        re-enables the controls the UI's handle is in use again while this may still run.
+        """
+        if os.path.splitext(path)[-1].lower() == ".parquet":
+            df = pd.read_parquet(path, columns=usecols, **READ_KWARGS)
+            # usecols does not guarantee column order
+            return df[usecols]
+
+        # Reloads of an unchanged workbook come from its Parquet snapshot
+        cache = self._cache_path(path, header_row, elapsed_mode)
+        try:
+            if os.path.getmtime(cache) >= os.path.getmtime(path):
+                return pd.read_parquet(cache, columns=usecols, **READ_KWARGS)[usecols]
+        except Exception:
+            pass  # no usable snapshot: missing, stale or lacking these columns
+
+        # Absolute times are parsed from strings later, so skip type inference on them
+        dtype = None if elapsed_mode else {time_col: "string"}
+        with self._open_workbook(path) as xlsx:
+            df = xlsx.parse(header=header_row, usecols=usecols, dtype=dtype, **READ_KWARGS)[usecols]
+        try:
+            df.to_parquet(cache, compression="zstd")
+        except Exception:
+            pass  # best effort: no pyarrow, read-only folder or a mixed-type column
+        return df
+
+    def _cache_path(self, path, header_row, elapsed_mode):
+        """
+        Location of the Parquet snapshot of workbook `path` read with `header_row` as
+        its header. The header row and time mode are part of the name because both
+        change the columns and types that are read.
+        """
+        mode = "elapsed" if elapsed_mode else "time"
+        return f"{path}.h{header_row}-{mode}.cache.parquet"
 
-        if self.elapsed_mode.get():
+    def _transform_data(self, df, elapsed_mode, test_date, time_col, pressure_cols):
+        """
+        Phase 2 of _process_data: convert the time column into elapsed seconds (or use
+        numeric elapsed directly). Returns the DataFrame and the elapsed column name.
+        """
+        if elapsed_mode:
             # Use numeric elapsed directly
-            self.df[self.time_col] = pd.to_numeric(self.df[self.time_col], errors="coerce")
-            self.elapsed_col = self.time_col
-        else:
-            # Parse absolute time: combine test_date + time strings
-            self.df["ParsedTime"] = pd.to_datetime(
-                self.test_date.strftime("%Y-%m-%d") + " " + self.df[self.time_col].astype(str),
-                errors="coerce",
-            )
-            for col in self.pressure_cols:
-                self.df[col] = pd.to_numeric(self.df[col], errors="coerce")
-            self.df.dropna(subset=["ParsedTime"], inplace=True)
-            self.elapsed_col = "Elapsed"
-            self.df[self.elapsed_col] = (
-                self.df["ParsedTime"] - self.df["ParsedTime"].iloc[0]
-            ).dt.total_seconds()
-        
+            df[time_col] = pd.to_numeric(df[time_col], errors="coerce")
+            return df, time_col
+
+        # Parse absolute time: combine test_date + time of day
+        df["ParsedTime"] = _parse_times(df[time_col], test_date)
+        for col in pressure_cols:
+            df[col] = pd.to_numeric(df[col], errors="coerce")
+        df.dropna(subset=["ParsedTime"], inplace=True)
+        elapsed_col = "Elapsed"
+        ns = df["ParsedTime"].to_numpy(dtype="datetime64[ns]").view("int64")
+        # Elapsed stays float64: float32 loses sub-second resolution after a few hours
+        df[elapsed_col] = (ns - ns[0]) / 1e9
+        # The timestamps were only needed for Elapsed; the original time column remains
+        df.drop(columns="ParsedTime", inplace=True)
+        return df, elapsed_col
+
+    def _poll_worker(self, results, gen, pressure_cols):
+        """
+        Main-thread poll for the result of load number `gen` on `results`. Installs the
+        loaded DataFrame (with its `pressure_cols`) and plots it, or reports a load
+        failure. Stops without acting once a newer load has started.
+        """
+        if gen != self._load_gen:
+            return
+        try:
+            status, payload, elapsed_col = results.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_worker, results, gen, pressure_cols)
+            return
 
-        self.finished_loading_event.set()
-        self.after(0, self._on_data_ready)
+        if status == "ok":
+            self.finished_loading_event.set()
+            self.df = payload
+            self.elapsed_col = elapsed_col
+            self.pressure_cols = pressure_cols
+            self._on_data_ready()
+        elif status == "error":
+            self.finished_loading_event.set()
+            tkmsg.showwarning("Incomplete", payload)
+            self._enable_controls()
+        # "cancelled": the date prompt already restored the controls
 
     def _on_data_ready(self):
         """
-        Called on the main thread once _process_data finishes.
+        Called on the main thread once _poll_worker receives the loaded data.
         Enable controls, set up rectangle selector, and draw initial plot.
         """
         self._enable_controls()
-        self.zones = []
-        self._enable_selector()
+        self._clear_zones()
+        # Materialize plotted columns once so plot/FFT paths skip pandas indexing
+        # Nullable (Arrow) columns need an explicit NaN for missing values
+        self._elapsed_np = self.df[self.elapsed_col].to_numpy(dtype=np.float64, na_value=np.nan)
+        # NaNs or a wrap past midnight break the ordering; zone lookups then fall back to masks
+        self._elapsed_sorted = bool(np.all(np.diff(self._elapsed_np) >= 0))
+        # float32 halves the bytes moved by plotting/FFT; sensor pressures need no more precision
+        self._P = np.ascontiguousarray(
+            self.df[self.pressure_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+        )
+        self._y_max = float(np.nanmax(self._P))
         self._redraw()
+        self._enable_selector()
 
     def _enable_selector(self):
         """
@@ -500,6 +847,12 @@ class AlphaAnalysisApp(ctk.CTk):
         if self.rs:
             self.rs.set_active(False)
             self.rs.disconnect_events()
+            # The axes are no longer cleared on every load, so drop the old selector's artists
+            for artist in self.rs.artists:
+                try:
+                    artist.remove()
+                except (ValueError, NotImplementedError):
+                    pass  # already detached by an axes clear
         self.rs = RectangleSelector(
             self.ax,
             self._on_select,
@@ -522,14 +875,12 @@ class AlphaAnalysisApp(ctk.CTk):
         if None in (x1, x2) or x2 - x1 < self.min_var.get():
             return
 
-        patch = self.ax.axvspan(x1, x2, color="red", alpha=0.3)
-        idx = len(self.zones) + 1
-        y_max = max(self.df[c].max() for c in self.pressure_cols)
-        label = self.ax.text(
-            (x1 + x2) / 2, y_max, str(idx), ha="center", bbox=dict(fc="yellow")
-        )
-        self.zones.append({"start": x1, "end": x2, "patch": patch, "label": label})
-        self.canvas.draw()
+        patch, label = self._add_zone_artists(x1, x2, len(self._zone_patches) + 1)
+        self._zone_starts = np.append(self._zone_starts, x1)
+        self._zone_ends = np.append(self._zone_ends, x2)
+        self._zone_patches.append(patch)
+        self._zone_labels.append(label)
+        self._blit_zones()
 
     def _on_click(self, event):
         """
@@ -539,111 +890,336 @@ class AlphaAnalysisApp(ctk.CTk):
         if event.button != 3 or event.inaxes != self.ax:
             return
         x = event.xdata
-        for i, z in enumerate(self.zones):
-            if z["start"] <= x <= z["end"]:
-                z["patch"].remove()
-                z["label"].remove()
-                self.zones.pop(i)
-                break
-        # Renumber labels
-        for idx, z in enumerate(self.zones, 1):
-            z["label"].set_text(str(idx))
-            z["label"].set_x((z["start"] + z["end"]) / 2)
-        self.canvas.draw()
+        # Zones keep drawing order and may overlap, so test all of them at once and
+        # take the first (oldest) hit, as the label numbering follows that order
+        hits = np.flatnonzero((self._zone_starts <= x) & (x <= self._zone_ends))
+        if not hits.size:
+            return
+        i = hits[0]
+        self._zone_patches.pop(i).remove()
+        self._zone_labels.pop(i).remove()
+        self._zone_starts = np.delete(self._zone_starts, i)
+        self._zone_ends = np.delete(self._zone_ends, i)
+        # Renumber the zones after the removed one; labels keep their positions
+        for idx, label in enumerate(self._zone_labels[i:], i + 1):
+            label.set_text(str(idx))
+        self._blit_zones()
+
+    def _add_zone_artists(self, start, end, idx):
+        """
+        Create the highlight patch and index label for a zone. Both are animated so
+        they are left out of full canvas draws and composited on top via blitting.
+        """
+        patch = self.ax.axvspan(start, end, color="red", alpha=0.3, animated=True)
+        label = self.ax.text(
+            (start + end) / 2, self._y_max, str(idx), ha="center", bbox=dict(fc="yellow"), animated=True
+        )
+        return patch, label
+
+    def _clear_zones(self):
+        """
+        Remove every zone's patch and label from the plot and forget the zones.
+        """
+        for artist in self._zone_patches + self._zone_labels:
+            artist.remove()
+        self._zone_starts = np.empty(0)
+        self._zone_ends = np.empty(0)
+        self._zone_patches = []
+        self._zone_labels = []
+
+    def _draw_zone_artists(self):
+        """
+        Render every zone patch and label into the canvas buffer.
+        """
+        for patch, label in zip(self._zone_patches, self._zone_labels):
+            self.ax.draw_artist(patch)
+            self.ax.draw_artist(label)
+
+    def _on_draw(self, event):
+        """
+        After every full canvas draw, cache the clean axes background and paint the
+        animated zone artists on top of it.
+        """
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_zone_artists()
+
+    def _invalidate_background(self, event=None):
+        """
+        Forget the cached background (canvas resized, limits or line data changed) so
+        the next zone update does a full draw instead of blitting a stale bitmap.
+        """
+        self._bg = None
+
+    def _blit_zones(self):
+        """
+        Refresh only the zone overlay: restore the cached background, redraw the zone
+        artists and blit the axes region, instead of re-rendering every pressure trace.
+        """
+        if self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_zone_artists()
+        self.canvas.blit(self.ax.bbox)
 
     def _redraw(self):
         """
-        Clear and redraw the entire pressure-vs-time plot: replot all pressure columns,
-        then re-draw saved zones (patch + label).
-        """
-        self.ax.clear()
-        for c in self.pressure_cols:
-            self.ax.plot(self.df[self.elapsed_col], self.df[c], label=c)
-        # Redraw each saved zone (if any)
-        for i, z in enumerate(self.zones, 1):
-            z["patch"] = self.ax.axvspan(z["start"], z["end"], color="red", alpha=0.3)
-            z["label"] = self.ax.text(
-                (z["start"] + z["end"]) / 2,
-                max(self.df[c].max() for c in self.pressure_cols),
-                str(i),
-                ha="center",
-                bbox=dict(fc="yellow"),
-            )
-        self.ax.set_xlabel("Elapsed Time [s]")
-        self.ax.legend()
-        self.ax.grid(True)
-        self.canvas.draw()
+        Plot the loaded data through one persistent Line2D per pressure column. The
+        lines (and legend) are only rebuilt when the set of columns changes; otherwise
+        their data is swapped in place with set_data.
+        """
+        if list(self._lines) != self.pressure_cols:
+            self.ax.clear()
+            self._lines = {c: self.ax.plot([], [], label=c)[0] for c in self.pressure_cols}
+            self.ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+            self.ax.set_xlabel("Elapsed Time [s]")
+            self.ax.legend()
+            self.ax.grid(True)
+        target = self._decimation_target()
+        for k, line in enumerate(self._lines.values()):
+            line.set_data(*_minmax_decimate(self._elapsed_np, self._P[:, k], target))
+        self._decim_key = None
+        self._invalidate_background()
+        self.ax.relim(visible_only=True)
+        self.ax.autoscale_view()
+        self.canvas.draw_idle()
+
+    def _decimation_target(self):
+        """
+        Number of points to keep per trace: two samples (min and max) per axes pixel.
+        """
+        return max(2 * int(self.ax.bbox.width), 2)
+
+    def _on_xlim_changed(self, ax):
+        """
+        Re-decimate the traces over the visible x-range whenever the user zooms or pans,
+        so zooming in reveals full-resolution data.
+        """
+        if self.df is None or not self._lines:
+            return
+        x0, x1 = sorted(ax.get_xlim())
+        target = self._decimation_target()
+        key = (x0, x1, target)
+        if key == self._decim_key:
+            return
+        self._decim_key = key
+
+        t = self._elapsed_np
+        # First and one-past-last visible sample: binary search on a sorted axis (this
+        # runs on every pan/zoom event), a mask scan otherwise
+        if self._elapsed_sorted:
+            first = np.searchsorted(t, x0, side="left")
+            stop = np.searchsorted(t, x1, side="right")
+        else:
+            visible = np.flatnonzero((t >= x0) & (t <= x1))
+            first, stop = (visible[0], visible[-1] + 1) if visible.size else (0, 0)
+        if first >= stop:
+            return
+        # Keep one sample either side so the lines run to the axes edges
+        lo = max(first - 1, 0)
+        hi = stop + 1
+        for k, line in enumerate(self._lines.values()):
+            x, y = _minmax_decimate(t[lo:hi], self._P[lo:hi, k], target)
+            line.set_data(x, y)
+        self._invalidate_background()
+
+    def _zone_bounds(self):
+        """
+        (start, end) pairs of the drawn zones, in zone-number order.
+        """
+        return list(zip(self._zone_starts.tolist(), self._zone_ends.tolist()))
+
+    def _zone_index(self, start, end):
+        """
+        Index selecting the samples with elapsed time in [start, end]. When the elapsed
+        column is sorted this is a slice found by binary search (O(log N), and a
+        zero-copy view when applied to an array); otherwise a boolean mask.
+        """
+        t = self._elapsed_np
+        if self._elapsed_sorted:
+            return slice(np.searchsorted(t, start, side="left"), np.searchsorted(t, end, side="right"))
+        if ne is not None:
+            return ne.evaluate("(t >= start) & (t <= end)", local_dict={"t": t, "start": start, "end": end})
+        return (t >= start) & (t <= end)
 
     def _confirm(self):
         """
         When the user clicks "Confirm Zones", show a summary dialog listing each zone's
-        start/end. If confirmed, open a new window per zone with time-domain and FFT plots.
+        start/end. If confirmed, show time-domain and FFT plots for every zone in the
+        tabbed zone analysis window.
         """
-        if not self.zones:
+        if not self._zone_patches:
             tkmsg.showwarning("No zones", "Please draw zones first.")
             return
+        # One analysis at a time; say so up front rather than drop a confirmed request
+        if self._zone_fft_pending:
+            tkmsg.showinfo("Busy", "The previous zone analysis is still running. Confirm again once its window opens.")
+            return
 
-        msgs = [f"Zone {i}: {z['start']:.2f}-{z['end']:.2f}" for i, z in enumerate(self.zones, 1)]
+        msgs = [f"Zone {i}: {start:.2f}-{end:.2f}" for i, (start, end) in enumerate(self._zone_bounds(), 1)]
         if not tkmsg.askokcancel("Confirm Zones", "\n".join(msgs)):
             return
 
-        for i, z in enumerate(self.zones, 1):
-            start, end = z["start"], z["end"]
-            zone_df = self.df[(self.df[self.elapsed_col] >= start) & (self.df[self.elapsed_col] <= end)].copy()
-            if zone_df.empty:
+        # The column names travel with the blocks: data may be reloaded with other
+        # columns before the worker's results are shown
+        cols = list(self.pressure_cols)
+        results = []
+        for i, (start, end) in enumerate(self._zone_bounds(), 1):
+            idx = self._zone_index(start, end)
+            t = self._elapsed_np[idx]
+            if t.size == 0:
                 tkmsg.showerror("Zone Error", f"Zone {i} is empty.")
                 continue
+            dt = _sample_spacing(t)
+            if dt is None:
+                tkmsg.showerror("Zone Error", f"Zone {i} has fewer than two samples or no time span, so it has no FFT.")
+                continue
+            results.append(
+                {"index": i, "start": start, "end": end, "t": t, "dt": dt, "block": self._P[idx], "cols": cols}
+            )
+
+        if results:
+            # FFTs run off the UI thread; _poll_zone_fft shows the window when done
+            self._zone_fft_pending = True
+            threading.Thread(target=self._compute_zone_ffts, args=(results,), daemon=True).start()
+            self.after(50, self._poll_zone_fft)
+
+    def _compute_zone_ffts(self, results):
+        """
+        Background worker: add "freqs" and "amps" (DC removed, scaled) to each zone
+        result, then post the list to self._zone_fft_results. No Tk calls here.
+        """
+        try:
+            for r in results:
+                r["freqs"] = _fft_freqs(len(r["t"]), r["dt"])
+
+            # Zones of equal length share one batched (zones, N, columns) transform,
+            # the rest get one (N, columns) call each
+            by_len = {}
+            for r in results:
+                by_len.setdefault(len(r["t"]), []).append(r)
+            for group in by_len.values():
+                amps = _fft_amplitudes(np.stack([r["block"] for r in group]))
+                for r, a in zip(group, amps):
+                    r["amps"] = a
+        except Exception:
+            results = None
+        self._zone_fft_results.put(results)
+
+    def _poll_zone_fft(self):
+        """
+        Main-thread poll for the _compute_zone_ffts result.
+        """
+        try:
+            results = self._zone_fft_results.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_zone_fft)
+            return
+        self._zone_fft_pending = False
+        if results is None:
+            tkmsg.showerror("Zone Error", "Zone FFT computation failed.")
+            return
+        self._show_zone_window(results)
+
+    def _build_zone_window(self):
+        """
+        Create the zone analysis window: a tab bar with one tab per zone above a single
+        Figure (time-domain + FFT axes) that is shared by every tab.
+        """
+        win = tk.Toplevel(self)
+        win.title("Zone Analysis")
+        win.geometry("700x900")
+
+        self._zone_tabs = ttk.Notebook(win)
+        self._zone_tabs.pack(fill=tk.X)
+        self._zone_tabs.bind("<<NotebookTabChanged>>", self._on_zone_tab_changed)
+
+        # Constrained layout is solved during the draw, so tab switches need no extra
+        # tight_layout() renderer pass
+        self._zone_fig = plt.Figure(figsize=(6, 8), dpi=100, constrained_layout=True)
+        self._zone_ax_time = self._zone_fig.add_subplot(211)
+        self._zone_ax_fft = self._zone_fig.add_subplot(212)
+
+        # Embed figure in Tk window
+        # Pack the toolbar first so it keeps its row when the window shrinks
+        canvas = FigureCanvasTkAgg(self._zone_fig, master=win)
+        canvas.draw()
+        toolbar = NavigationToolbar2Tk(canvas, win, pack_toolbar=False)
+        toolbar.update()
+        toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self._zone_canvas = canvas
+        self._zone_toolbar = toolbar
+
+        # Overlay logo in the top-left corner of the plot
+        logo_widget = canvas.get_tk_widget()
+        canvas_bg = logo_widget.cget("bg")
+        logo_label = tk.Label(win, bd=0, bg=canvas_bg, highlightthickness=0, image=self.logo)
+        logo_label.place(in_=logo_widget, relx=0, rely=0, anchor="nw")
+        logo_label.lift(logo_widget)
 
-            # Create separate window for zone analysis
-            win = tk.Toplevel(self)
-            win.title(f"Zone {i} Analysis")
-            win.geometry("700x900")
-
-            fig = plt.Figure(figsize=(6, 8), dpi=100)
-            ax_time = fig.add_subplot(211)
-            ax_fft = fig.add_subplot(212)
-
-            # Time-domain plot
-            for col in self.pressure_cols:
-                ax_time.plot(zone_df[self.elapsed_col], zone_df[col], label=col)
-            ax_time.set_title(f"Zone {i} Time Series: {start:.2f}s to {end:.2f}s")
-            ax_time.set_xlabel("Elapsed Time [s]")
-            ax_time.set_ylabel("Pressure")
-            ax_time.legend()
-            ax_time.grid(True)
-
-            # FFT plot (DC removed, scaled)
-            dt = np.mean(np.diff(zone_df[self.elapsed_col].values))
-            for col in self.pressure_cols:
-                data = zone_df[col].values
-                data = data - np.mean(data)
-                N = len(data)
-                freqs = np.fft.rfftfreq(N, d=dt)
-                fft_vals = np.abs(np.fft.rfft(data))
-                fft_vals *= 2 / N
-                ax_fft.plot(freqs, fft_vals, label=col)
-            ax_fft.set_title(f"Zone {i} FFT (DC Removed)")
-            ax_fft.set_xlabel("Frequency [Hz]")
-            ax_fft.set_ylabel("Amplitude")
-            ax_fft.legend()
-            ax_fft.grid(True)
-
-            fig.tight_layout()
-
-            # Embed figure in Tk window
-            canvas = FigureCanvasTkAgg(fig, master=win)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            toolbar = NavigationToolbar2Tk(canvas, win)
-            toolbar.update()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-
-            # Overlay logo in the new window
-            logo_widget = canvas.get_tk_widget()
-            canvas_bg = logo_widget.cget("bg")
-            logo_label = tk.Label(win, bd=0, bg=canvas_bg, highlightthickness=0, image=self.logo)
-            logo_label.place(relx=0, rely=0, anchor="nw")
-            logo_label.lift(canvas.get_tk_widget())
+        self._zone_win = win
+
+    def _show_zone_window(self, results):
+        """
+        Show the per-zone results in the zone analysis window, reusing the window and
+        its Figure if it is already open. Lines are created once here; switching tabs
+        only swaps their data.
+        """
+        if self._zone_win is None or not self._zone_win.winfo_exists():
+            self._build_zone_window()
+
+        self._zone_results = results
+        for tab in self._zone_tabs.tabs():
+            self._zone_tabs.forget(tab)
+            self.nametowidget(tab).destroy()
+
+        ax_time, ax_fft = self._zone_ax_time, self._zone_ax_fft
+        ax_time.cla()
+        ax_fft.cla()
+        cols = results[0]["cols"]
+        self._zone_time_lines = [ax_time.plot([], [], label=c)[0] for c in cols]
+        self._zone_fft_lines = [ax_fft.plot([], [], label=c)[0] for c in cols]
+        ax_time.set_xlabel("Elapsed Time [s]")
+        ax_time.set_ylabel("Pressure")
+        ax_time.legend()
+        ax_time.grid(True)
+        ax_fft.set_xlabel("Frequency [Hz]")
+        ax_fft.set_ylabel("Amplitude")
+        ax_fft.legend()
+        ax_fft.grid(True)
+
+        for r in results:
+            self._zone_tabs.add(ttk.Frame(self._zone_tabs, height=1), text=f"Zone {r['index']}")
+        self._zone_tabs.select(0)
+        self._show_zone(0)
+        self._zone_win.lift()
+
+    def _on_zone_tab_changed(self, event):
+        """
+        Swap the shared zone Figure over to the zone of the newly selected tab.
+        """
+        if self._zone_tabs.tabs():
+            self._show_zone(self._zone_tabs.index("current"))
+
+    def _show_zone(self, k):
+        """
+        Load the cached time series and FFT of zone `k` into the persistent lines.
+        """
+        r = self._zone_results[k]
+        for c, line in enumerate(self._zone_time_lines):
+            line.set_data(r["t"], r["block"][:, c])
+        for c, line in enumerate(self._zone_fft_lines):
+            line.set_data(r["freqs"], r["amps"][:, c])
+        i, start, end = r["index"], r["start"], r["end"]
+        self._zone_ax_time.set_title(f"Zone {i} Time Series: {start:.2f}s to {end:.2f}s")
+        self._zone_ax_fft.set_title(f"Zone {i} FFT (DC Removed)")
+        for ax in (self._zone_ax_time, self._zone_ax_fft):
+            ax.relim()
+            ax.autoscale_view()
+
+        self._zone_toolbar.update()  # reset the zoom/pan history for the new zone
+        self._zone_canvas.draw_idle()
 
     def _save_analysis(self):
         """
@@ -698,11 +1274,11 @@ class AlphaAnalysisApp(ctk.CTk):
                     text.append(wrapped_path)
                     text.append(f"Pressure Columns: {', '.join(self.pressure_cols)}")
                     text.append("\nZone Summary:")
-                    if not self.zones:
+                    if not self._zone_patches:
                         text.append("None")
                     else:
-                        for i, z in enumerate(self.zones, 1):
-                            text.append(f"Zone {i}: {z['start']:.2f}s to {z['end']:.2f}s")
+                        for i, (start, end) in enumerate(self._zone_bounds(), 1):
+                            text.append(f"Zone {i}: {start:.2f}s to {end:.2f}s")
                     fig_sum.text(0.05, 0.5, "\n".join(text), ha="left", va="center", fontsize=10)
                     pdf.savefig(fig_sum)
                     plt.close(fig_sum)
@@ -710,13 +1286,13 @@ class AlphaAnalysisApp(ctk.CTk):
                     # Page 2: overall plot with zones
                     fig_all = plt.figure(figsize=(8.27, 11.69))
                     ax_all = fig_all.add_subplot(111)
-                    for c in self.pressure_cols:
-                        ax_all.plot(self.df[self.elapsed_col], self.df[c], label=c)
-                    for i, z in enumerate(self.zones, 1):
-                        ax_all.axvspan(z["start"], z["end"], color="red", alpha=0.3)
+                    for k, c in enumerate(self.pressure_cols):
+                        ax_all.plot(self._elapsed_np, self._P[:, k], label=c)
+                    for i, (start, end) in enumerate(self._zone_bounds(), 1):
+                        ax_all.axvspan(start, end, color="red", alpha=0.3)
                         ax_all.text(
-                            (z["start"] + z["end"]) / 2,
-                            max(self.df[c].max() for c in self.pressure_cols) * 0.95,
+                            (start + end) / 2,
+                            self._y_max * 0.95,
                             str(i),
                             ha="center",
                             va="top",
@@ -731,33 +1307,35 @@ class AlphaAnalysisApp(ctk.CTk):
                     plt.close(fig_all)
 
                     # Pages per zone
-                    for i, z in enumerate(self.zones, 1):
-                        start, end = z["start"], z["end"]
-                        zone_df = self.df[(self.df[self.elapsed_col] >= start) & (self.df[self.elapsed_col] <= end)].copy()
-                        if zone_df.empty:
+                    for i, (start, end) in enumerate(self._zone_bounds(), 1):
+                        idx = self._zone_index(start, end)
+                        t = self._elapsed_np[idx]
+                        if t.size == 0:
                             continue
                         fig_zone = plt.figure(figsize=(8.27, 11.69))
                         ax_time = fig_zone.add_subplot(211)
                         ax_fft = fig_zone.add_subplot(212)
 
-                        for col in self.pressure_cols:
-                            ax_time.plot(zone_df[self.elapsed_col], zone_df[col], label=col)
+                        block = self._P[idx]
+                        for k, col in enumerate(self.pressure_cols):
+                            ax_time.plot(t, block[:, k], label=col)
                         ax_time.set_title(f"Zone {i} Time Series: {start:.2f}s to {end:.2f}s")
                         ax_time.set_xlabel("Elapsed Time [s]")
                         ax_time.set_ylabel("Pressure")
                         ax_time.legend()
                         ax_time.grid(True)
 
-                        dt = np.mean(np.diff(zone_df[self.elapsed_col].values))
-                        for col in self.pressure_cols:
-                            data = zone_df[col].values
-                            data = data - np.mean(data)
-                            N = len(data)
-                            freqs = np.fft.rfftfreq(N, d=dt)
-                            fft_vals = np.abs(np.fft.rfft(data))
-                            fft_vals *= 2 / N
-                            ax_fft.plot(freqs, fft_vals, label=col)
-                        ax_fft.set_title(f"Zone {i} FFT (DC Removed)")
+                        # Same batched transform as the zone window; copy since it demeans in place.
+                        # A zone spanning no time keeps its time-series page but has no FFT
+                        dt = _sample_spacing(t)
+                        if dt is not None:
+                            freqs = _fft_freqs(len(t), dt)
+                            amps = _fft_amplitudes(np.array(block))
+                            for k, col in enumerate(self.pressure_cols):
+                                ax_fft.plot(freqs, amps[:, k], label=col)
+                            ax_fft.set_title(f"Zone {i} FFT (DC Removed)")
+                        else:
+                            ax_fft.set_title(f"Zone {i} FFT: fewer than two samples or no time span")
                         ax_fft.set_xlabel("Frequency [Hz]")
                         ax_fft.set_ylabel("Amplitude")
                         ax_fft.legend()
@@ -776,7 +1354,7 @@ class AlphaAnalysisApp(ctk.CTk):
         Export each drawn zone into its own Parquet file.
         Prompts for a folder, then writes zone_1.parquet, zone_2.parquet, etc.
         """
-        if self.df is None or not self.zones:
+        if self.df is None or not self._zone_patches:
             tkmsg.showwarning("Nothing to Export", "Load data and draw zones first.")
             return
 
@@ -786,13 +1364,9 @@ class AlphaAnalysisApp(ctk.CTk):
             return  # user canceled
 
         count = 0
-        for i, z in enumerate(self.zones, start=1):
-            start, end = z["start"], z["end"]
-            # Slice out the DataFrame rows where elapsed_col ∈ [start, end]
-            zone_df = self.df[
-                (self.df[self.elapsed_col] >= start) &
-                (self.df[self.elapsed_col] <= end)
-            ].copy()
+        for i, (start, end) in enumerate(self._zone_bounds(), start=1):
+            # Rows where elapsed_col ∈ [start, end]; only read, so no defensive copy
+            zone_df = self.df.iloc[self._zone_index(start, end)]
 
             if zone_df.empty:
                 continue
@@ -816,18 +1390,17 @@ class AlphaAnalysisApp(ctk.CTk):
 
     def _get_loading_frames(self):
         """
-        Load all frames from the loading GIF into a list for animation.
+        Decode all frames of the loading GIF into RGBA images.
         """
-        gif = Image.open(self.loading_gif_path)
-        frames = []
-        try:
-            while True:
-                frame = ImageTk.PhotoImage(gif.copy().convert("RGBA"))
-                frames.append(frame)
-                gif.seek(len(frames))
-        except EOFError:
-            pass
-        return frames
+        with Image.open(self.loading_gif_path) as gif:
+            # convert() returns a detached copy, so the frames outlive the file handle
+            return [f.convert("RGBA") for f in ImageSequence.Iterator(gif)]
+
+    def _set_loading_frames(self, frames):
+        """
+        Store the decoded GIF frames as an immutable tuple of PhotoImages.
+        """
+        self.loading_gif_frames = tuple(ImageTk.PhotoImage(f) for f in frames)
 
     def _next_frame(self):
         """
@@ -835,8 +1408,12 @@ class AlphaAnalysisApp(ctk.CTk):
         Otherwise hide the loading label.
         """
         if self.loading_gif_frames:
-            self.current_frame = (self.current_frame + 1) % len(self.loading_gif_frames)
-            self.loading_label.config(image=self.loading_gif_frames[self.current_frame])
+            # Pick the frame from wall-clock time so a busy main loop skips frames
+            # instead of slowing the animation down
+            frame = int((time.perf_counter() - self._gif_t0) / 0.033) % len(self.loading_gif_frames)
+            if frame != self.current_frame:
+                self.current_frame = frame
+                self.loading_label.config(image=self.loading_gif_frames[frame])
             if not self.finished_loading_event.is_set():
                 self.loading_label.after(33, self._next_frame)
             else:
@@ -848,10 +1425,12 @@ class AlphaAnalysisApp(ctk.CTk):
         Show the loading GIF in the center of the plotting canvas while data is loading.
         """
         if not self.loading_gif_frames:
-            self.loading_gif_frames = self._get_loading_frames()
+            self._set_loading_frames(self._get_loading_frames())
         self.loading_label.place(relx=0.5, rely=0.5, anchor="center")
         self.loading_label.lift(self.canvas.get_tk_widget())
         self.loading_label.config(image=self.loading_gif_frames[0])
+        self.current_frame = 0
+        self._gif_t0 = time.perf_counter()
         self._next_frame()
 
     def _disable_controls(self):
@@ -903,6 +1482,7 @@ class AlphaAnalysisApp(ctk.CTk):
             self.after_cancel(self._resize_job)
             self._resize_job = None
         if tkmsg.askokcancel("Quit", "Do you really want to quit?"):
+            self._executor.shutdown(wait=False, cancel_futures=True)
             self.quit()
 
     # ────────────────────────────────────────────────────────────────────────────